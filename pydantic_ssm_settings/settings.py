@@ -1,6 +1,8 @@
 import logging
-from typing import Any, Tuple, Type
+from typing import Any, ClassVar, Dict, Optional, Tuple, Type
 
+from pydantic import PrivateAttr
+from pydantic.fields import FieldInfo
 from pydantic_settings import (
     BaseSettings,
     EnvSettingsSource,
@@ -10,7 +12,7 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
-from .source import AwsSsmSettingsSource
+from .source import AwsSsmSettingsSource, check_ssm_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +21,93 @@ class SsmSettingsConfigDict(SettingsConfigDict):
     ssm_prefix: str
 
 
-class BaseSettingsSsmWrapper(BaseSettings):
+_SOURCE_NAMES = (
+    "init_settings",
+    "env_settings",
+    "dotenv_settings",
+    "file_secret_settings",
+    "ssm_settings",
+)
+
+
+class _CachedSettingsSource(PydanticBaseSettingsSource):
+    """
+    Wrap a source so that its values are only computed once, even though they
+    are requested both by pydantic-settings and by the SSM source.
+    """
+
+    def __init__(self, source: PydanticBaseSettingsSource) -> None:
+        super().__init__(source.settings_cls)
+        self.source = source
+        self._values: Optional[Dict[str, Any]] = None
+        # pydantic-settings >= 2.5 records the values of each source under its
+        # name, report the wrapped source's rather than this wrapper's
+        self.__name__ = type(source).__name__
+
+    def _set_current_state(self, state: Dict[str, Any]) -> None:
+        self.source._set_current_state(state)  # type: ignore[attr-defined]
+
+    def _set_settings_sources_data(self, states: Dict[str, Dict[str, Any]]) -> None:
+        self.source._set_settings_sources_data(states)  # type: ignore[attr-defined]
+
+    def get_field_value(
+        self, field: FieldInfo, field_name: str
+    ) -> Tuple[Any, str, bool]:
+        return self.source.get_field_value(field, field_name)
+
+    def __call__(self) -> Dict[str, Any]:
+        if self._values is None:
+            self._values = self.source()
+        return self._values
+
+    def __repr__(self) -> str:
+        return repr(self.source)
+
+
+class AwsSsmSourceConfig(BaseSettings):
     """
-    Wrapper to store the _ssm_prefix parameter as an instance attribute.
-    Need a direct access to the attributes dictionary to avoid raising an AttributeError:
-    __pydantic_private__ exception
+    Settings loading values missing from the builtin sources from SSM.
+
+    The _ssm_prefix parameter is stored as a private attribute. The order in
+    which the sources take precedence is read from `sources_order`, which
+    subclasses may override with any ordering of the same source names.
+
+    With `case_sensitive=True`, the parameters of the declared fields are fetched
+    by name. Otherwise (the pydantic-settings default), every parameter under the
+    prefix is listed, since SSM parameter names are matched case sensitively.
     """
 
-    def __init__(self, *args, _ssm_prefix: str = None, **kwargs: Any) -> None:
+    sources_order: ClassVar[Tuple[str, ...]] = _SOURCE_NAMES
+
+    _ssm_prefix: Optional[str] = PrivateAttr(default=None)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """
+        Validate the configured prefix and sources order once, when the settings
+        class is defined, rather than waiting for it to be instantiated.
+        """
+        super().__pydantic_init_subclass__(**kwargs)
+        for name in cls.sources_order:
+            if name not in _SOURCE_NAMES:
+                raise ValueError(
+                    f"Unknown source {name!r} in sources_order of {cls.__name__}, "
+                    f"expected one of {', '.join(_SOURCE_NAMES)}"
+                )
+            if cls.sources_order.count(name) > 1:
+                raise ValueError(
+                    f"Source {name!r} appears more than once in sources_order "
+                    f"of {cls.__name__}"
+                )
+        if "ssm_settings" not in cls.sources_order:
+            raise ValueError(
+                f"sources_order of {cls.__name__} must include 'ssm_settings'"
+            )
+        ssm_prefix = cls.model_config.get("ssm_prefix")
+        if ssm_prefix is not None:
+            check_ssm_prefix(ssm_prefix)
+
+    def __init__(self, *args, _ssm_prefix: Optional[str] = None, **kwargs: Any) -> None:
         """
         Args:
             _ssm_prefix: Prefix for all ssm parameters. Must be an absolute path,
@@ -34,11 +115,12 @@ class BaseSettingsSsmWrapper(BaseSettings):
             is treated case sensitively regardless of the _case_sensitive
             parameter value.
         """
-        self.__dict__["__ssm_prefix"] = _ssm_prefix
-        super().__init__(self, *args, **kwargs)
+        # The settings sources are built before pydantic initialises the private
+        # attributes, seed them so that _ssm_prefix can already be read then.
+        object.__setattr__(self, "__pydantic_private__", {"_ssm_prefix": _ssm_prefix})
+        super().__init__(*args, **kwargs)
+        self._ssm_prefix = _ssm_prefix
 
-
-class AwsSsmSourceConfig(BaseSettingsSsmWrapper):
     def settings_customise_sources(
         self,
         settings_cls: Type[BaseSettings],
@@ -47,15 +129,21 @@ class AwsSsmSourceConfig(BaseSettingsSsmWrapper):
         dotenv_settings: PydanticBaseSettingsSource,
         file_secret_settings: SecretsSettingsSource,
     ) -> Tuple[PydanticBaseSettingsSource, ...]:
-        ssm_settings = AwsSsmSettingsSource(
+        sources: Dict[str, PydanticBaseSettingsSource] = {
+            "init_settings": init_settings,
+            "env_settings": env_settings,
+            "dotenv_settings": dotenv_settings,
+            "file_secret_settings": file_secret_settings,
+        }
+        ssm_index = self.sources_order.index("ssm_settings")
+        higher_priority_sources = []
+        for name in self.sources_order[:ssm_index]:
+            sources[name] = _CachedSettingsSource(sources[name])
+            higher_priority_sources.append(sources[name])
+        sources["ssm_settings"] = AwsSsmSettingsSource(
             settings_cls=settings_cls,
-            ssm_prefix=self.__dict__["__ssm_prefix"],
+            ssm_prefix=self._ssm_prefix,
+            higher_priority_sources=higher_priority_sources,
         )
 
-        return (
-            init_settings,
-            env_settings,
-            dotenv_settings,
-            file_secret_settings,
-            ssm_settings,
-        )
+        return tuple(sources[name] for name in self.sources_order)
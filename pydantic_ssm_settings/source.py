@@ -2,8 +2,12 @@ from __future__ import annotations as _annotations
 
 import logging
 import os
-from pathlib import Path
-from typing import TYPE_CHECKING, Any
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, Sequence, cast
 
 import boto3
 from botocore.client import Config
@@ -14,32 +18,133 @@ from pydantic.fields import FieldInfo
 from pydantic_settings import BaseSettings
 from pydantic_settings.sources import (
     EnvSettingsSource,
+    PydanticBaseSettingsSource,
 )
 
+from .trie import PrefixTrie
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from pydantic_settings import (  # type: ignore[attr-defined]
+        ForceDecode,
+        NoDecode,
+    )
+except ImportError:  # pragma: no cover
+    # pydantic-settings < 2.7 always decodes complex values
+    ForceDecode = NoDecode = None  # type: ignore[assignment,misc]
+
 if TYPE_CHECKING:
     from mypy_boto3_ssm.client import SSMClient
 
 
 logger = logging.getLogger(__name__)
 
+# Allow threaded applications to share connections instead of re-opening them
+SSM_MAX_POOL_CONNECTIONS = 50
+# Upper bound on the number of concurrent SSM requests issued by a single source
+SSM_MAX_FETCH_WORKERS = 8
+# Upper bound on the number of names accepted by a single GetParameters call
+GET_PARAMETERS_MAX_NAMES = 10
+
+# Annotations that are never complex, skipping the typing introspection
+_SIMPLE_SCALARS = frozenset({str, int, float, bool, bytes})
+
+# Parameters fetched recently, shared by every source of the process so that
+# repeatedly building the same settings doesn't request SSM each time. Entries
+# map a fetch key to the time they expire at and the fetched parameters.
+_SSM_CACHE: dict[tuple[Any, ...], tuple[float, dict[str, str]]] = {}
+_SSM_CACHE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _get_ssm_client(
+    connect_timeout: float, read_timeout: float, region: str | None = None
+) -> "SSMClient":
+    """
+    Build a single SSM client per configuration. Client creation resolves
+    credentials and loads the service model, which is far more expensive than
+    reusing an existing (thread-safe) client.
+    """
+    return boto3.client(
+        "ssm",
+        region_name=region,
+        config=Config(
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            max_pool_connections=SSM_MAX_POOL_CONNECTIONS,
+        ),
+    )
+
 
 class SettingsError(ValueError):
     pass
 
 
+def check_ssm_prefix(ssm_prefix: object) -> None:
+    if not isinstance(ssm_prefix, str):
+        raise ValueError(f"SSM prefix must be a string, not {ssm_prefix!r}")
+    if not ssm_prefix.startswith("/"):
+        raise ValueError("SSM prefix must be absolute path")
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only mapping whose content is only loaded on first access, so that
+    no request is sent to SSM unless a value is actually looked up.
+    """
+
+    def __init__(self, loader: Callable[[], dict[str, str]]) -> None:
+        self._loader = loader
+        self._data: dict[str, str] | None = None
+
+    @property
+    def data(self) -> dict[str, str]:
+        if self._data is None:
+            self._data = self._loader()
+        return self._data
+
+    def __getitem__(self, key: str) -> str:
+        return self.data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
 class AwsSsmSettingsSource(EnvSettingsSource):
+    # Field metadata never changes once a model class is defined, so the
+    # results derived from it are shared by every instance of the source.
+    _field_is_complex_cache: ClassVar[dict[FieldInfo, tuple[bool, bool]]] = {}
+    _field_info_cache: ClassVar[
+        dict[tuple[FieldInfo, str, str, bool], list[tuple[str, str, bool]]]
+    ] = {}
+
     def __init__(
         self,
         settings_cls: type[BaseSettings],
-        case_sensitive: bool = None,
-        ssm_prefix: str = None,
+        case_sensitive: Optional[bool] = None,
+        ssm_prefix: Optional[str] = None,
+        higher_priority_sources: Sequence[PydanticBaseSettingsSource] = (),
     ):
+        """
+        Args:
+            higher_priority_sources: Sources taking precedence over SSM. Simple
+            fields they already provide are not looked up, which avoids
+            requesting SSM at all when every field is provided.
+        """
+        self.higher_priority_sources = higher_priority_sources
         # Ideally would retrieve ssm_prefix from self.config
         # but need the superclass to be initialized for that
         ssm_prefix_ = (
             ssm_prefix
             if ssm_prefix is not None
-            else settings_cls.model_config.get("ssm_prefix", "/")
+            else cast(str, settings_cls.model_config.get("ssm_prefix", "/"))
         )
         super().__init__(
             settings_cls,
@@ -50,14 +155,23 @@ class AwsSsmSettingsSource(EnvSettingsSource):
         self.ssm_prefix = ssm_prefix_
         assert self.ssm_prefix == self.env_prefix
 
+        # Prefixes of nested parameters, mapped to the field they belong to
+        self._field_prefixes = PrefixTrie()
+        for field_name, field in settings_cls.model_fields.items():
+            for _, env_name, _ in self._extract_field_info(field, field_name):
+                self._field_prefixes.insert(
+                    f"{env_name}{self.env_nested_delimiter}", field_name
+                )
+        self._nested_by_field: dict[str, dict[str, str | None]] | None = None
+
     @property
     def client(self) -> "SSMClient":
-        return boto3.client("ssm", config=self.client_config)
+        timeout = float(os.environ.get("SSM_TIMEOUT", 0.5))
+        return _get_ssm_client(timeout, timeout, self.region)
 
     @property
-    def client_config(self) -> Config:
-        timeout = float(os.environ.get("SSM_TIMEOUT", 0.5))
-        return Config(connect_timeout=timeout, read_timeout=timeout)
+    def region(self) -> str | None:
+        return os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION")
 
     def _load_env_vars(
         self,
@@ -65,34 +179,154 @@ class AwsSsmSettingsSource(EnvSettingsSource):
         """
         Access env_prefix instead of ssm_prefix
         """
-        if not Path(self.env_prefix).is_absolute():
-            raise ValueError("SSM prefix must be absolute path")
+        check_ssm_prefix(self.env_prefix)
+
+        return LazyMapping(self._fetch_parameters)
+
+    def _fetch_parameters(self) -> dict[str, str]:
+        targets = self._ssm_parameter_targets()
+        cache_key = (
+            self.region,
+            self.env_prefix,
+            self.case_sensitive,
+            None if targets is None else (tuple(targets[0]), tuple(targets[1])),
+        )
+        ttl = float(os.environ.get("SSM_CACHE_TTL", 5))
+        if ttl > 0:
+            now = time.monotonic()
+            with _SSM_CACHE_LOCK:
+                # Drop expired entries so that the cache doesn't keep growing
+                # when many distinct prefixes are used
+                expired = [key for key, entry in _SSM_CACHE.items() if entry[0] <= now]
+                for key in expired:
+                    del _SSM_CACHE[key]
+                cached = _SSM_CACHE.get(cache_key)
+            if cached is not None:
+                return cached[1]
 
         logger.debug(f"Building SSM settings with prefix of {self.env_prefix=}")
 
-        output = {}
+        output: dict[str, str] = {}
         try:
-            paginator = self.client.get_paginator("get_parameters_by_path")
-            response_iterator = paginator.paginate(
-                Path=self.env_prefix, WithDecryption=True, Recursive=True
+            if targets is None:
+                output.update(self._load_parameters_by_path(self.env_prefix))
+            else:
+                names, nested_paths = targets
+                output.update(self._load_parameters_by_name(names))
+                output.update(self._load_nested_parameters(nested_paths))
+        except ClientError:
+            logger.exception("Failed to get parameters from %s", self.env_prefix)
+            return output
+
+        if ttl > 0:
+            with _SSM_CACHE_LOCK:
+                _SSM_CACHE[cache_key] = (time.monotonic() + ttl, output)
+        return output
+
+    def _ssm_parameter_targets(self) -> tuple[dict[str, str], list[str]] | None:
+        """
+        Find where the parameters declared by the settings model live.
+
+        Returns a mapping of the exact SSM parameter names to the keys they are
+        stored under, and the paths under which the nested parameters of complex
+        fields have to be discovered.
+
+        Returns `None` when the names can't be known up front, in which case
+        every parameter under the prefix has to be discovered: aliases aren't
+        prefixed and SSM names can't be matched case insensitively.
+        """
+        if not self.case_sensitive:
+            return None
+
+        base = self.env_prefix.rstrip("/") + "/"
+        names = {}
+        nested_paths = []
+        for field_name, field in self.settings_cls.model_fields.items():
+            if field.validation_alias is not None:
+                return None
+            names[base + field_name] = self.env_prefix + field_name
+            if self._field_is_complex(field)[0]:
+                nested_paths.append(base + field_name)
+        return names, nested_paths
+
+    def _load_parameters_by_name(self, names: dict[str, str]) -> dict[str, str]:
+        output = {}
+        ssm_names = list(names)
+        for i in range(0, len(ssm_names), GET_PARAMETERS_MAX_NAMES):
+            response = self.client.get_parameters(
+                Names=ssm_names[i : i + GET_PARAMETERS_MAX_NAMES], WithDecryption=True
             )
+            for parameter in response["Parameters"]:
+                output[names[parameter["Name"]]] = parameter["Value"]
+        return output
 
-            for page in response_iterator:
-                for parameter in page["Parameters"]:
-                    key = (
-                        Path(parameter["Name"]).relative_to(self.env_prefix).as_posix()
-                    )
-                    output[
-                        self.env_prefix + key
-                        if self.case_sensitive
-                        else self.env_prefix.lower() + key.lower()
-                    ] = parameter["Value"]
+    def _load_nested_parameters(self, paths: list[str]) -> dict[str, str]:
+        """
+        Discover the parameters under each path, concurrently when there are
+        several of them since each discovery is bound by SSM round-trips.
+        """
+        output: dict[str, str] = {}
+        if len(paths) <= 1:
+            for path in paths:
+                output.update(self._load_parameters_by_path(path))
+            return output
 
-        except ClientError:
-            logger.exception("Failed to get parameters from %s", self.env_prefix)
+        with ThreadPoolExecutor(
+            max_workers=min(len(paths), SSM_MAX_FETCH_WORKERS)
+        ) as executor:
+            for parameters in executor.map(self._load_parameters_by_path, paths):
+                output.update(parameters)
+        return output
+
+    def _load_parameters_by_path(self, path: str) -> dict[str, str]:
+        output = {}
+        paginator = self.client.get_paginator("get_parameters_by_path")
+        response_iterator = paginator.paginate(
+            Path=path, WithDecryption=True, Recursive=True
+        )
 
+        # SSM names are plain POSIX paths, slicing the prefix off is enough
+        prefix = self.env_prefix.rstrip("/") + "/"
+        prefix_len = len(prefix)
+        parameters = (
+            parameter for page in response_iterator for parameter in page["Parameters"]
+        )
+        # Branch on case sensitivity once rather than for every parameter
+        if self.case_sensitive:
+            key_prefix = self.env_prefix
+            for parameter in parameters:
+                name = parameter["Name"]
+                if name.startswith(prefix):
+                    output[key_prefix + name[prefix_len:]] = parameter["Value"]
+        else:
+            key_prefix = self.env_prefix.lower()
+            lower = str.lower
+            for parameter in parameters:
+                name = parameter["Name"]
+                if name.startswith(prefix):
+                    output[key_prefix + lower(name[prefix_len:])] = parameter["Value"]
         return output
 
+    def _field_is_complex(self, field: FieldInfo) -> tuple[bool, bool]:
+        # Annotations aren't necessarily hashable (e.g. Annotated metadata)
+        if isinstance(field.annotation, type) and field.annotation in _SIMPLE_SCALARS:
+            return False, False
+        result = self._field_is_complex_cache.get(field)
+        if result is None:
+            result = super()._field_is_complex(field)
+            self._field_is_complex_cache[field] = result
+        return result
+
+    def _extract_field_info(
+        self, field: FieldInfo, field_name: str
+    ) -> list[tuple[str, str, bool]]:
+        key = (field, field_name, self.env_prefix, self.case_sensitive)
+        result = self._field_info_cache.get(key)
+        if result is None:
+            result = super()._extract_field_info(field, field_name)
+            self._field_info_cache[key] = result
+        return result
+
     def __repr__(self) -> str:
         return f"AwsSsmSettingsSource(ssm_prefix={self.env_prefix!r})"
 
@@ -112,25 +346,117 @@ class AwsSsmSettingsSource(EnvSettingsSource):
                 a flag to determine whether value is complex.
         """
 
+        return self._lookup_field_value(self._extract_field_info(field, field_name))
+
+    def _lookup_field_value(
+        self, field_info: list[tuple[str, str, bool]]
+    ) -> tuple[Any, str, bool]:
         # env_name = /asdf/foo
         # env_vars = {foo:xyz}
         env_val: str | None = None
-        for field_key, env_name, value_is_complex in self._extract_field_info(
-            field, field_name
-        ):
+        for field_key, env_name, value_is_complex in field_info:
             env_val = self.env_vars.get(env_name)
             if env_val is not None:
                 break
 
         return env_val, field_key, value_is_complex
 
+    def decode_complex_value(
+        self, field_name: str, field: FieldInfo, value: Any
+    ) -> Any:
+        """
+        Decode the value for a complex field, with orjson when it is installed.
+        Values orjson rejects (e.g. NaN literals or integers beyond 64 bits) and
+        fields opting out of decoding are handed over to the pydantic-settings
+        implementation so results don't differ.
+        """
+        if orjson is not None and not self._decoding_disabled(field):
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+        return super().decode_complex_value(field_name, field, value)
+
+    def _decoding_disabled(self, field: FieldInfo) -> bool:
+        if NoDecode is None or not field:
+            return False
+        return NoDecode in field.metadata or (
+            self.config.get("enable_decoding") is False
+            and ForceDecode not in field.metadata
+        )
+
+    def explode_env_vars(
+        self, field_name: str, field: FieldInfo, env_vars: Mapping[str, str | None]
+    ) -> dict[str, Any]:
+        """
+        Process env_vars and extract the values of keys containing
+        env_nested_delimiter into nested dictionaries.
+
+        Keys are only compared with the field prefixes once: the first call
+        partitions every nested key by the field owning it, and the
+        EnvSettingsSource implementation is then only given the keys of the
+        field being processed.
+
+        Args:
+            field_name: The field name.
+            field: The field.
+            env_vars: Environment variables.
+
+        Returns:
+            A dictionary contains extracted values from nested env values.
+        """
+        if env_vars is self.env_vars:
+            if self._nested_by_field is None:
+                self._nested_by_field = self._partition_by_field(env_vars)
+            nested_by_field = self._nested_by_field
+        else:
+            nested_by_field = self._partition_by_field(env_vars)
+
+        nested_env_vars = nested_by_field.get(field_name)
+        if not nested_env_vars:
+            return {}
+        return super().explode_env_vars(field_name, field, nested_env_vars)
+
+    def _partition_by_field(
+        self, env_vars: Mapping[str, str | None]
+    ) -> dict[str, dict[str, str | None]]:
+        """
+        Group nested keys by the field they belong to, dropping the others.
+        """
+        nested_by_field: dict[str, dict[str, str | None]] = {}
+        for env_name, env_val in env_vars.items():
+            field_name = self._field_prefixes.longest_match(env_name)
+            if field_name is not None:
+                nested_by_field.setdefault(field_name, {})[env_name] = env_val
+        return nested_by_field
+
+    def _provided_field_keys(self) -> set[str]:
+        provided: set[str] = set()
+        for source in self.higher_priority_sources:
+            provided.update(source())
+        return provided
+
     def __call__(self) -> dict[str, Any]:
+        """
+        Same as the PydanticBaseEnvSettingsSource implementation, but the field
+        metadata is only looked up once per field and shared between checking
+        whether a higher priority source provides it and looking up its value.
+        """
         data: dict[str, Any] = {}
+        provided = self._provided_field_keys()
 
         for field_name, field in self.settings_cls.model_fields.items():
+            field_info = self._extract_field_info(field, field_name)
+            is_complex = self._field_is_complex(field)[0]
+            if not is_complex and any(
+                field_key in provided for field_key, _, _ in field_info
+            ):
+                # Complex fields may still be completed from nested parameters
+                continue
+
             try:
-                field_value, field_key, value_is_complex = self.get_field_value(
-                    field, field_name
+                field_value, field_key, value_is_complex = self._lookup_field_value(
+                    field_info
                 )
             except Exception as e:
                 raise SettingsError(
@@ -0,0 +1,38 @@
+from __future__ import annotations as _annotations
+
+from typing import Any
+
+# Key under which a node stores the value of the prefix ending at that node.
+# Characters are always strings of length one, so this can't clash with them.
+_VALUE = None
+
+
+class PrefixTrie:
+    """
+    Character trie mapping prefixes to values, used to find which prefix a key
+    starts with in a single pass over the key.
+    """
+
+    def __init__(self) -> None:
+        self._root: dict[Any, Any] = {}
+
+    def insert(self, prefix: str, value: Any) -> None:
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[_VALUE] = value
+
+    def longest_match(self, key: str) -> Any:
+        """
+        Return the value of the longest inserted prefix of `key`, or `None` if
+        no inserted prefix matches. Stops at the first mismatching character.
+        """
+        node = self._root
+        match = node.get(_VALUE)
+        for char in key:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            match = node.get(_VALUE, match)
+        return match
@@ -4,6 +4,8 @@ import boto3
 import pytest
 from moto import mock_ssm
 
+from pydantic_ssm_settings.source import _SSM_CACHE
+
 
 @pytest.fixture(scope="function")
 def aws_credentials():
@@ -15,6 +17,12 @@ def aws_credentials():
     os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
 
 
+@pytest.fixture(autouse=True)
+def clear_ssm_cache():
+    """Parameters cached by a test must not leak into the next one."""
+    _SSM_CACHE.clear()
+
+
 @pytest.fixture(scope="function")
 def ssm(aws_credentials):
     with mock_ssm():
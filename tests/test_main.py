@@ -1,15 +1,37 @@
 import logging
+import math
+import time
+from enum import Enum
+from pathlib import Path
+from typing import Dict, List
 
+from typing_extensions import Annotated
+from unittest import mock
+
+import boto3
+import pydantic_settings
 import pytest
 from pydantic import (
     BaseModel,
+    field_validator,
+)
+from pydantic_settings import (
+    InitSettingsSource,
+    SecretsSettingsSource,
+    SettingsConfigDict,
 )
-from pydantic_settings import SettingsConfigDict
 
 from pydantic_ssm_settings import (
+    AwsSsmSettingsSource,
     AwsSsmSourceConfig,
     SsmSettingsConfigDict,
 )
+from pydantic_ssm_settings.settings import _CachedSettingsSource
+from pydantic_ssm_settings.source import _SSM_CACHE
+
+PYDANTIC_SETTINGS_VERSION = tuple(
+    int(part) for part in pydantic_settings.__version__.split(".")[:2]
+)
 
 logger = logging.getLogger("pydantic_ssm_settings")
 logger.setLevel(logging.DEBUG)
@@ -37,6 +59,15 @@ def test_ssm_prefix_must_be_absolute():
         SimpleSettings(_ssm_prefix="asdf")
 
 
+@pytest.mark.parametrize("prefix", ["asdf", Path("/asdf")])
+def test_configured_ssm_prefix_must_be_absolute(prefix):
+    with pytest.raises(ValueError):
+
+        class RelativePrefixSettings(AwsSsmSourceConfig):
+            model_config = SsmSettingsConfigDict(ssm_prefix=prefix)
+            foo: str
+
+
 def test_lookup_from_ssm(ssm):
     ssm.put_parameter(Name="/foo", Value="bar")
     settings = SimpleSettings()
@@ -47,6 +78,15 @@ def test_lookup_from_ssm_with_prefix(ssm):
     ssm.put_parameter(Name="/asdf/foo", Value="bar")
     settings = SimpleSettings(_ssm_prefix="/asdf")
     assert settings.foo == "bar"
+    assert settings._ssm_prefix == "/asdf"
+    assert settings.model_dump() == {"foo": "bar"}
+
+
+def test_secure_string_is_decrypted(ssm):
+    ssm.put_parameter(Name="/foo", Value="secret", Type="SecureString")
+    ssm.put_parameter(Name="/bar", Value="99", Type="String")
+    assert SimpleSettings().foo == "secret"
+    assert CaseSensitiveSettings().foo == "secret"
 
 
 def test_casting(ssm):
@@ -63,6 +103,39 @@ def test_parameter_override(ssm):
     assert s.foo == "param_bar"
 
 
+def test_ssm_not_requested_when_provided(ssm):
+    with mock.patch.object(AwsSsmSettingsSource, "_fetch_parameters") as fetch:
+        s = SimpleSettings(foo="param_bar")
+    assert s.foo == "param_bar"
+    fetch.assert_not_called()
+
+
+def test_sources_called_once(tmp_path, ssm):
+    (tmp_path / "foo").write_text("secret_bar")
+    with mock.patch.object(
+        SecretsSettingsSource,
+        "__call__",
+        autospec=True,
+        side_effect=SecretsSettingsSource.__call__,
+    ) as secrets_call:
+        s = SimpleSettings(_secrets_dir=tmp_path)
+    assert s.foo == "secret_bar"
+    assert secrets_call.call_count == 1
+
+
+@pytest.mark.skipif(
+    PYDANTIC_SETTINGS_VERSION < (2, 7), reason="source state not supported"
+)
+def test_cached_source_forwards_state():
+    source = InitSettingsSource(SimpleSettings, init_kwargs={"foo": "bar"})
+    cached = _CachedSettingsSource(source)
+    cached._set_current_state({"foo": "state"})
+    cached._set_settings_sources_data({"InitSettingsSource": {"foo": "bar"}})
+    assert cached.__name__ == "InitSettingsSource"
+    assert source.current_state == {"foo": "state"}
+    assert source.settings_sources_data == {"InitSettingsSource": {"foo": "bar"}}
+
+
 def test_dotenv_override(tmp_path, ssm):
     ssm.put_parameter(Name="/foo", Value="ssm_bar")
     p = tmp_path / ".env"
@@ -79,6 +152,47 @@ def test_env_override(env, ssm):
     assert s.foo == "env_bar"
 
 
+def test_env_override_case_insensitive(env, ssm):
+    ssm.put_parameter(Name="/foo", Value="ssm_bar")
+    env.set("FOO", "env_bar")
+    s = SimpleSettings()
+    assert s.foo == "env_bar"
+
+
+class SsmFirstSettings(AwsSsmSourceConfig):
+    sources_order = (
+        "init_settings",
+        "ssm_settings",
+        "env_settings",
+        "dotenv_settings",
+        "file_secret_settings",
+    )
+    foo: str
+
+
+def test_sources_order(env, ssm):
+    ssm.put_parameter(Name="/foo", Value="ssm_bar")
+    env.set("foo", "env_bar")
+    assert SsmFirstSettings().foo == "ssm_bar"
+    assert SsmFirstSettings(foo="param_bar").foo == "param_bar"
+
+
+@pytest.mark.parametrize(
+    "order, message",
+    [
+        (("init_settings", "env_settings"), "must include 'ssm_settings'"),
+        (("init_settings", "env_setings", "ssm_settings"), "'env_setings'"),
+        (("ssm_settings", "init_settings", "ssm_settings"), "more than once"),
+    ],
+)
+def test_sources_order_must_be_valid(order, message):
+    with pytest.raises(ValueError, match=message):
+
+        class InvalidOrderSettings(AwsSsmSourceConfig):
+            sources_order = order
+            foo: str
+
+
 def test_secret_override(tmp_path, ssm):
     p = tmp_path / "foo"
     p.write_text("secret_bar")
@@ -93,6 +207,51 @@ def test_nested_parameters(ssm):
     assert settings.foo.bar == "bar_value"
 
 
+class SiblingSetting(AwsSsmSourceConfig):
+    foo: ChildSetting
+    baz: ChildSetting
+
+
+def test_nested_parameters_multiple_fields(ssm):
+    ssm.put_parameter(Name="/foo/bar", Value="foo_value")
+    ssm.put_parameter(Name="/baz/bar", Value="baz_value")
+    ssm.put_parameter(Name="/foobar/bar", Value="unrelated")
+    settings = SiblingSetting()
+    assert settings.foo.bar == "foo_value"
+    assert settings.baz.bar == "baz_value"
+
+
+class MiddleSetting(BaseModel):
+    child: ChildSetting
+
+
+class GrandParentSetting(AwsSsmSourceConfig):
+    foo: MiddleSetting
+
+
+def test_deeply_nested_parameters(ssm):
+    ssm.put_parameter(Name="/asdf/foo/child/bar", Value="bar_value")
+    settings = GrandParentSetting(_ssm_prefix="/asdf")
+    assert settings.foo.child.bar == "bar_value"
+
+
+class CaseSensitiveNestedSettings(AwsSsmSourceConfig):
+    model_config = SettingsConfigDict(case_sensitive=True)
+    name: str
+    foo: ChildSetting
+    baz: ChildSetting
+
+
+def test_nested_parameters_by_field_path(ssm):
+    ssm.put_parameter(Name="/asdf/name", Value="xyz123")
+    ssm.put_parameter(Name="/asdf/foo/bar", Value="foo_value")
+    ssm.put_parameter(Name="/asdf/baz", Value='{"bar": "baz_value"}')
+    settings = CaseSensitiveNestedSettings(_ssm_prefix="/asdf")
+    assert settings.name == "xyz123"
+    assert settings.foo.bar == "foo_value"
+    assert settings.baz.bar == "baz_value"
+
+
 def test_ssm_parameter_json(ssm):
     ssm.put_parameter(Name="/foo", Value='{"bar": "xyz123"}')
     settings = ParentSetting()
@@ -106,6 +265,121 @@ def test_ssm_parameter_json_override(ssm):
     assert settings.foo.bar == "overwritten"
 
 
+class FloatMapSettings(AwsSsmSourceConfig):
+    foo: Dict[str, float]
+
+
+def test_ssm_parameter_json_non_standard(ssm):
+    ssm.put_parameter(Name="/foo", Value='{"bar": NaN, "baz": 1.5}')
+    settings = FloatMapSettings()
+    assert math.isnan(settings.foo["bar"])
+    assert settings.foo["baz"] == 1.5
+
+
+class UnhashableAnnotationSettings(AwsSsmSourceConfig):
+    foo: str
+    bar: Dict[str, Annotated[int, {"doc": "x"}]] = {}
+
+
+def test_unhashable_annotation(ssm):
+    ssm.put_parameter(Name="/foo", Value="xyz123")
+    ssm.put_parameter(Name="/bar", Value='{"baz": 1}')
+    settings = UnhashableAnnotationSettings()
+    assert settings.foo == "xyz123"
+    assert settings.bar == {"baz": 1}
+
+
+class InnerSetting(BaseModel):
+    x: int
+
+
+class CamelCaseChildSetting(BaseModel):
+    subModel: InnerSetting
+
+
+class CamelCaseParentSetting(AwsSsmSourceConfig):
+    foo: CamelCaseChildSetting
+
+
+@pytest.mark.skipif(
+    PYDANTIC_SETTINGS_VERSION < (2, 7),
+    reason="nested field lookup is too limited in older pydantic-settings",
+)
+def test_nested_parameters_camel_case(ssm):
+    ssm.put_parameter(Name="/foo/subModel", Value='{"x": 1}')
+    settings = CamelCaseParentSetting()
+    assert settings.foo.subModel.x == 1
+
+
+class NestedDictSettings(AwsSsmSourceConfig):
+    foo: Dict[str, Dict[str, int]]
+
+
+@pytest.mark.skipif(
+    PYDANTIC_SETTINGS_VERSION < (2, 7),
+    reason="nested field lookup is too limited in older pydantic-settings",
+)
+def test_nested_parameters_dict(ssm):
+    ssm.put_parameter(Name="/foo/bar", Value='{"x": 1}')
+    settings = NestedDictSettings()
+    assert settings.foo == {"bar": {"x": 1}}
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class EnumSettings(AwsSsmSourceConfig):
+    model_config = SettingsConfigDict(env_parse_enums=True)
+    color: Color
+
+
+@pytest.mark.skipif(
+    PYDANTIC_SETTINGS_VERSION < (2, 7), reason="env_parse_enums not supported"
+)
+def test_parse_enums(ssm):
+    ssm.put_parameter(Name="/color", Value="RED")
+    settings = EnumSettings()
+    assert settings.color is Color.RED
+
+
+if PYDANTIC_SETTINGS_VERSION >= (2, 7):
+    from pydantic_settings import NoDecode
+
+    class NoDecodeSettings(AwsSsmSourceConfig):
+        nums: Annotated[List[str], NoDecode]
+
+        @field_validator("nums", mode="before")
+        @classmethod
+        def split_nums(cls, value: str) -> List[str]:
+            assert isinstance(value, str)
+            return [value]
+
+
+@pytest.mark.skipif(PYDANTIC_SETTINGS_VERSION < (2, 7), reason="NoDecode not supported")
+def test_no_decode(ssm):
+    ssm.put_parameter(Name="/nums", Value="[1]")
+    settings = NoDecodeSettings()
+    assert settings.nums == ["[1]"]
+
+
+class TwoFieldChildSetting(BaseModel):
+    bar: str
+    baz: str
+
+
+class TwoFieldParentSetting(AwsSsmSourceConfig):
+    foo: TwoFieldChildSetting
+
+
+def test_ssm_parameter_json_partial_override(ssm):
+    ssm.put_parameter(Name="/foo", Value='{"bar": "xyz123", "baz": "abc"}')
+    ssm.put_parameter(Name="/foo/baz", Value="overwritten")
+    settings = TwoFieldParentSetting()
+    assert settings.foo.bar == "xyz123"
+    assert settings.foo.baz == "overwritten"
+
+
 class CaseInsensitiveSettings(AwsSsmSourceConfig):
     model_config = SettingsConfigDict(case_sensitive=False)
     foo: str
@@ -126,3 +400,69 @@ def test_parameters_from_model_config(ssm):
     ssm.put_parameter(Name="/asdf/foo", Value="bar")
     settings = CustomConfigDict()
     assert settings.foo == "bar"
+
+
+def test_ssm_client_is_reused(ssm):
+    first = AwsSsmSettingsSource(SimpleSettings).client
+    second = AwsSsmSettingsSource(SimpleSettings).client
+    assert first is second
+
+
+class CaseSensitiveSettings(AwsSsmSourceConfig):
+    model_config = SettingsConfigDict(case_sensitive=True)
+    foo: str
+    bar: int
+
+
+def test_lookup_by_name(ssm):
+    ssm.put_parameter(Name="/asdf/foo", Value="xyz123")
+    ssm.put_parameter(Name="/asdf/bar", Value="99")
+    ssm.put_parameter(Name="/asdf/unrelated", Value="ignored")
+    client = AwsSsmSettingsSource(CaseSensitiveSettings).client
+    with mock.patch.object(
+        client, "get_parameters", wraps=client.get_parameters
+    ) as get_parameters, mock.patch.object(
+        client, "get_paginator", wraps=client.get_paginator
+    ) as get_paginator:
+        settings = CaseSensitiveSettings(_ssm_prefix="/asdf")
+    assert settings.foo == "xyz123"
+    assert settings.bar == 99
+    get_parameters.assert_called_once_with(
+        Names=["/asdf/foo", "/asdf/bar"], WithDecryption=True
+    )
+    get_paginator.assert_not_called()
+
+
+def test_parameters_are_cached(ssm):
+    ssm.put_parameter(Name="/foo", Value="bar")
+    assert SimpleSettings().foo == "bar"
+    ssm.put_parameter(Name="/foo", Value="updated", Overwrite=True)
+    assert SimpleSettings().foo == "bar"
+
+
+def test_parameters_cache_disabled(env, ssm):
+    env.set("SSM_CACHE_TTL", "0")
+    ssm.put_parameter(Name="/foo", Value="bar")
+    assert SimpleSettings().foo == "bar"
+    ssm.put_parameter(Name="/foo", Value="updated", Overwrite=True)
+    assert SimpleSettings().foo == "updated"
+
+
+def test_parameters_cache_per_region(env, ssm):
+    ssm.put_parameter(Name="/foo", Value="east")
+    boto3.client("ssm", region_name="eu-west-1").put_parameter(
+        Name="/foo", Value="west"
+    )
+    assert SimpleSettings().foo == "east"
+    env.set("AWS_REGION", "eu-west-1")
+    assert SimpleSettings().foo == "west"
+
+
+def test_expired_parameters_are_evicted(env, ssm):
+    env.set("SSM_CACHE_TTL", "0.01")
+    ssm.put_parameter(Name="/asdf/foo", Value="bar")
+    ssm.put_parameter(Name="/qwer/foo", Value="bar")
+    SimpleSettings(_ssm_prefix="/asdf")
+    time.sleep(0.02)
+    SimpleSettings(_ssm_prefix="/qwer")
+    assert len(_SSM_CACHE) == 1
@@ -0,0 +1,11 @@
+from pydantic_ssm_settings.trie import PrefixTrie
+
+
+def test_longest_match():
+    trie = PrefixTrie()
+    trie.insert("/foo/", "foo")
+    trie.insert("/foo/bar/", "bar")
+    assert trie.longest_match("/foo/baz") == "foo"
+    assert trie.longest_match("/foo/bar/baz") == "bar"
+    assert trie.longest_match("/foobar") is None
+    assert trie.longest_match("") is None